@@ -1,74 +1,99 @@
 import streamlit as st
 import json
 import pandas as pd
-import plotly.express as px
+import numpy as np
+import atexit
+import copy
+import mmap
 import os
-from datetime import datetime, date
+import threading
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, time
+from functools import lru_cache
 
-from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from streamlit.errors import StreamlitAPIException
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 # Your actual data structure
-DEFAULT_DATA = {
-  "Level1Groups": [
-    {
-      "name": "GroupA",
-      "subsystems": [
+@st.cache_resource
+def _default_data() -> dict:
+    """Seed data used when data.json is missing or unreadable; built once per process"""
+    return {
+      "Level1Groups": [
         {
-          "name": "SubsystemX",
-          "pipelines": {
-            "streaming": {
-              "finalized": 0,
-              "uat": 0,
-              "planned": 0,
-              "production": 0
-            },
-            "batch": {
-              "finalized": 0,
-              "uat": 0,
-              "planned": 0,
-              "production": 0
-            }
-          },
-          "contacts": {
-            "producerTech": [
-              "Alice",
-              "Bob"
-            ],
-            "producerBusiness": [
-              "Eve"
-            ],
-            "ourTech": [
-              "Charlie"
-            ],
-            "ourBusiness": [
-              "Diana"
-            ]
-          },
-          "issues": [
-            {
-              "id": "ISS-101",
-              "description": "Data delay from source",
-              "status": "Open",
-              "start_date": "2025-08-27",
-              "close_date": None
-            },
+          "name": "GroupA",
+          "subsystems": [
             {
-              "id": "ISS-102",
-              "description": "Schema mismatch on v2",
-              "status": "In Progress",
-              "start_date": "2025-08-25",
-              "close_date": None
+              "name": "SubsystemX",
+              "pipelines": {
+                "streaming": {
+                  "finalized": 0,
+                  "uat": 0,
+                  "planned": 0,
+                  "production": 0
+                },
+                "batch": {
+                  "finalized": 0,
+                  "uat": 0,
+                  "planned": 0,
+                  "production": 0
+                }
+              },
+              "contacts": {
+                "producerTech": [
+                  "Alice",
+                  "Bob"
+                ],
+                "producerBusiness": [
+                  "Eve"
+                ],
+                "ourTech": [
+                  "Charlie"
+                ],
+                "ourBusiness": [
+                  "Diana"
+                ]
+              },
+              "issues": [
+                {
+                  "id": "ISS-101",
+                  "description": "Data delay from source",
+                  "status": "Open",
+                  "start_date": "2025-08-27",
+                  "close_date": None
+                },
+                {
+                  "id": "ISS-102",
+                  "description": "Schema mismatch on v2",
+                  "status": "In Progress",
+                  "start_date": "2025-08-25",
+                  "close_date": None
+                }
+              ],
+              "pipelineDetails": {
+                "streaming": [],
+                "batch": []
+              }
             }
-          ],
-          "pipelineDetails": {
-            "streaming": [],
-            "batch": []
-          }
+          ]
         }
       ]
     }
-  ]
-}
+
+# Formats of the times and dates stored in data.json
+TIME_FMT = "%H:%M"
+DATE_FMT = "%Y-%m-%d"
 
 STAGE_DISPLAY = {
     "finalized": "Finalized",
@@ -77,66 +102,203 @@ STAGE_DISPLAY = {
     "production": "Production",
 }
 
+# Pipeline status (lower-cased) to the stage it is counted under; anything else is finalized
+STATUS_STAGE = {
+    "uat": "uat",
+    "prod": "production",
+    "planned": "planned",
+    "blocked": "finalized",  # Blocked pipelines count as finalized for now
+}
+
+# Pipeline status choices in the admin forms, and each one's position
+STATUS_OPTIONS = ("Planned", "UAT", "PROD", "Blocked")
+STATUS_INDEX = {status: i for i, status in enumerate(STATUS_OPTIONS)}
+
+# Issue age buckets: recent (<= 7 days), moderate (<= 30 days), old
+AGE_BINS = (7, 30)
+AGE_ICONS = ("🟢", "🟡", "🔴")
+_AGE_ICONS_ARRAY = np.array(AGE_ICONS)
+
 # Consistent color mapping for pipeline types
 PIPELINE_COLORS = {
     "batch": "#1f77b4",      # Dark blue
     "streaming": "#87ceeb"   # Light blue
 }
 
-# Pipeline field definitions with tooltips
-BATCH_FIELDS = {
-    "pipeline_name": "Actual name of pipeline",
-    "data_name": "What business/producer team recognize this data flow",
-    "frequency": "Frequency of file publish (daily, weekly, monthly)",
-    "run_day": "Which day of week/month this file will be pushed",
-    "run_timestamp": "Exact time of run",
-    "file_size": "File size in MB",
-    "uat_date": "Planned UAT deploy date",
-    "prod_date": "Planned PROD deploy date",
-    "status": "Current pipeline status",
-    "comment": "Additional comments or notes"
-}
+# Pipeline field definitions with tooltips; attribute order is the template column order
+BATCH_FIELDS = SimpleNamespace(
+    pipeline_name="Actual name of pipeline",
+    data_name="What business/producer team recognize this data flow",
+    frequency="Frequency of file publish (daily, weekly, monthly)",
+    run_day="Which day of week/month this file will be pushed",
+    run_timestamp="Exact time of run",
+    file_size="File size in MB",
+    uat_date="Planned UAT deploy date",
+    prod_date="Planned PROD deploy date",
+    status="Current pipeline status",
+    comment="Additional comments or notes",
+)
 
-STREAMING_FIELDS = {
-    "pipeline_name": "Actual name of pipeline",
-    "data_name": "What business/producer team recognize this data flow",
-    "start_time": "Streaming start time",
-    "end_time": "Streaming end time",
-    "run_day": "Which day of week/month this file will be pushed",
-    "rough_volume": "Total size in MB between start and end time",
-    "uat_date": "Planned UAT deploy date",
-    "prod_date": "Planned PROD deploy date",
-    "status": "Current pipeline status",
-    "comment": "Additional comments or notes"
+STREAMING_FIELDS = SimpleNamespace(
+    pipeline_name="Actual name of pipeline",
+    data_name="What business/producer team recognize this data flow",
+    start_time="Streaming start time",
+    end_time="Streaming end time",
+    run_day="Which day of week/month this file will be pushed",
+    rough_volume="Total size in MB between start and end time",
+    uat_date="Planned UAT deploy date",
+    prod_date="Planned PROD deploy date",
+    status="Current pipeline status",
+    comment="Additional comments or notes",
+)
+
+# Form fields that must be filled before a pipeline can be saved, with their widget labels
+REQUIRED_BATCH = {
+    "pipeline_name": "Pipeline Name",
+    "data_name": "Data Name",
+    "frequency": "Frequency",
+    "run_day": "Run Day",
+    "file_size": "File Size (MB)",
+}
+REQUIRED_STREAM = {
+    "pipeline_name": "Pipeline Name",
+    "data_name": "Data Name",
+    "start_time": "Start Time",
+    "end_time": "End Time",
+    "run_day": "Run Day",
+    "rough_volume": "Volume (MB)",
 }
 
-def load_data() -> dict:
-    """Load data from JSON file, create default if file doesn't exist"""
+# Admin form feedback shared by the batch, streaming and issue editors
+MSG_REQUIRED = "Please fill in all required fields (marked with *)"
+MSG_PIPELINE_ADDED = "Added new {} pipeline: {}".format
+MSG_PIPELINE_UPDATED = "Pipeline updated!"
+MSG_PIPELINE_SAVE_FAILED = "Failed to save pipeline. Please try again."
+MSG_PIPELINE_UPDATE_FAILED = "Failed to update pipeline. Please try again."
+MSG_ISSUE_ADDED = "Added new issue: {}".format
+MSG_ISSUE_UPDATED = "Issue updated!"
+MSG_ISSUE_SAVE_FAILED = "Failed to save issue. Please try again."
+MSG_ISSUE_UPDATE_FAILED = "Failed to update issue. Please try again."
+
+def json_loads(buf) -> dict:
+    """Parse JSON from bytes-like input, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(bytes(buf))
+
+def json_dumps(obj, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys, ensure_ascii=False).encode("utf-8")
+
+@st.cache_data(show_spinner=False)
+def _read_data_file(data_file: str, mtime: float) -> dict:
+    """Parse the data file; cached per path and modification time"""
+    with open(data_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap can't map an empty file; let the parser report it as invalid JSON
+            data = json_loads(b"")
+        else:
+            # Parse straight from the page cache instead of copying the file into a bytes object
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as buf:
+                data = json_loads(buf)
+    # Ensure all subsystems have pipelineDetails
+    for group in data.get("Level1Groups", []):
+        for subsystem in group.get("subsystems", []):
+            if "pipelineDetails" not in subsystem:
+                subsystem["pipelineDetails"] = {"streaming": [], "batch": []}
+    return data
+
+def load_data() -> tuple[dict, float]:
+    """Load data from JSON file, create default if file doesn't exist
+
+    Also returns the data file version that was read (its mtime, 0.0 for the
+    default data), so every per-version cache is keyed on the same stat.
+    """
     data_file = "data.json"
+    # Make sure a save queued by the previous run is on disk before reading
+    wait_for_pending_save()
     
-    if os.path.exists(data_file):
-        try:
-            with open(data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                # Ensure all subsystems have pipelineDetails
-                for group in data.get("Level1Groups", []):
-                    for subsystem in group.get("subsystems", []):
-                        if "pipelineDetails" not in subsystem:
-                            subsystem["pipelineDetails"] = {"streaming": [], "batch": []}
-                return data
-        except (json.JSONDecodeError, FileNotFoundError) as e:
-            st.warning(f"Error loading data file: {e}. Using default data.")
-            return DEFAULT_DATA
-    else:
+    try:
+        data_version = os.stat(data_file).st_mtime
+    except FileNotFoundError:
         # Create default data file if it doesn't exist
-        save_data(DEFAULT_DATA)
-        return DEFAULT_DATA
+        data = copy.deepcopy(_default_data())
+        save_data(data)
+        return data, 0.0
+    try:
+        return _read_data_file(data_file, data_version), data_version
+    except (json.JSONDecodeError, FileNotFoundError) as e:
+        st.warning(f"Error loading data file: {e}. Using default data.")
+        return copy.deepcopy(_default_data()), 0.0
+
+@st.cache_resource
+def _save_worker() -> dict:
+    """Single background writer shared by all sessions, plus its unwritten payload and the job that will write it"""
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="data-save")
+    # Flush whatever is still queued when the server shuts down
+    atexit.register(executor.shutdown, wait=True)
+    return {"executor": executor, "latest": None, "queued": None, "lock": threading.Lock()}
+
+def _write_data_file(payload: bytes, data_file: str = "data.json"):
+    """Atomically replace the data file: write a sibling temp file, then swap it in"""
+    tmp_file = data_file + ".tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(payload)
+        # Get the bytes to disk before the rename makes them the live file
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, data_file)
+    invalidate_data_caches()
+
+def _write_latest(worker: dict, data_file: str = "data.json"):
+    """Write the newest queued payload
+
+    Takes the worker state bound at submit time, so clearing the resource
+    cache while the job is queued can't hand it an empty replacement.
+    """
+    with worker["lock"]:
+        payload, worker["latest"] = worker["latest"], None
+        # Saves arriving from here on need a job of their own
+        worker["queued"] = None
+    _write_data_file(payload, data_file)
+
+def wait_for_pending_save() -> bool:
+    """Block until this session's last queued save has finished; report it if it failed"""
+    pending = st.session_state.pop("pending_save", None)
+    if pending is None:
+        return True
+    try:
+        pending.result()
+        return True
+    except Exception as e:
+        st.error(f"Error saving data: {e}")
+        return False
 
 def save_data(data: dict) -> bool:
-    """Save data to JSON file"""
+    """Save data to JSON file
+
+    The data is serialized immediately, so later edits to the dict don't leak
+    into this save; the disk write itself runs on a background thread, and
+    saves queued behind a running write collapse into one write of the newest.
+    Returns False if the data couldn't be serialized; a failed disk write is
+    reported by this session's next load_data.
+    """
     try:
-        with open("data.json", 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        payload = json_dumps(data, indent=True)
+        worker = _save_worker()
+        with worker["lock"]:
+            worker["latest"] = payload
+            if worker["queued"] is None:
+                worker["queued"] = worker["executor"].submit(_write_latest, worker)
+            # Track the job that writes this payload, even when another session queued it
+            st.session_state.pending_save = worker["queued"]
         # Reset modification flag after successful save
         if 'data_modified' in st.session_state:
             st.session_state.data_modified = False
@@ -145,35 +307,64 @@ def save_data(data: dict) -> bool:
         st.error(f"Error saving data: {e}")
         return False
 
+def invalidate_data_caches():
+    """Drop everything cached per data file version after the file is rewritten
+
+    Saves within the filesystem's mtime resolution would otherwise be served
+    from the entries cached for the previous write.
+    """
+    _read_data_file.clear()
+    subsystem_totals.clear()
+    build_navigation.clear()
+
 def mark_data_modified():
     """Mark data as modified to show save warning"""
     st.session_state.data_modified = True
 
 def get_today_string():
     """Get today's date as string in YYYY-MM-DD format"""
-    return date.today().strftime("%Y-%m-%d")
+    return date.today().strftime(DATE_FMT)
 
-def calculate_blocked_days(start_date_str, close_date_str=None):
-    """Calculate blocked days between start and close date (or today if not closed)"""
+@lru_cache(maxsize=4096)
+def _blocked_days_between(start_date_str, end_date_str):
+    """Days between two ISO date strings, clamped at 0; 0 when either is invalid"""
     try:
-        start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-        if close_date_str:
-            end_date = datetime.strptime(close_date_str, "%Y-%m-%d").date()
-        else:
-            end_date = date.today()
-        
-        delta = end_date - start_date
+        delta = date.fromisoformat(end_date_str) - date.fromisoformat(start_date_str)
         return max(0, delta.days)
     except (ValueError, TypeError):
         return 0
 
+def calculate_blocked_days(start_date_str, close_date_str=None, today=None):
+    """Calculate blocked days between start and close date (or today if not closed)"""
+    # Resolve "today" before the cached lookup so open issues keep ageing across days
+    end_date_str = close_date_str or (today or date.today()).strftime(DATE_FMT)
+    return _blocked_days_between(start_date_str, end_date_str)
+
+def calculate_blocked_days_series(start_dates: list, close_dates: list, today_str: str | None = None) -> pd.Series:
+    """Vectorized calculate_blocked_days over parallel lists of start and close dates"""
+    today_str = today_str or get_today_string()
+    starts = pd.to_datetime(pd.Series(start_dates, dtype=object), format=DATE_FMT, errors="coerce")
+    closes = pd.to_datetime(pd.Series([close_date or today_str for close_date in close_dates], dtype=object),
+                            format=DATE_FMT, errors="coerce")
+    return (closes - starts).dt.days.clip(lower=0).fillna(0).astype(np.int32)
+
+@lru_cache(maxsize=4096)
+def _parse_time(time_str: str) -> time:
+    """Parse a stored HH:MM time for a time_input default"""
+    return time.fromisoformat(time_str)
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> date:
+    """Parse a stored YYYY-MM-DD date for a date_input default"""
+    return date.fromisoformat(date_str)
+
+@lru_cache(maxsize=4096)
 def format_date_display(date_str):
     """Format date string for display"""
     if not date_str:
         return "Not set"
     try:
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        return date_obj.strftime("%B %d, %Y")
+        return date.fromisoformat(date_str).strftime("%B %d, %Y")
     except ValueError:
         return date_str
 
@@ -185,78 +376,128 @@ def validate_date_range(start_date, close_date):
 
 def get_issue_age_color(blocked_days):
     """Get color indicator based on issue age"""
-    if blocked_days <= 7:
-        return "🟢"  # Green for recent
-    elif blocked_days <= 30:
-        return "🟡"  # Yellow for moderate
-    else:
-        return "🔴"  # Red for old
+    return AGE_ICONS[bisect_left(AGE_BINS, blocked_days)]
 
-def extract_pipelines(data: dict) -> pd.DataFrame:
-    records = []
-    for group in data.get("Level1Groups", []):
-        for subsystem in group.get("subsystems", []):
-            for ptype, stages in subsystem.get("pipelines", {}).items():
-                for stage_key, count in stages.items():
-                    records.append({
-                        "Group": group.get("name"),
-                        "Subsystem": subsystem.get("name"),
-                        "PipelineType": ptype,
-                        "StageKey": stage_key,
-                        "Stage": STAGE_DISPLAY.get(stage_key, stage_key.title()),
-                        "Count": int(count or 0),
-                    })
-    df = pd.DataFrame.from_records(records)
-    if df.empty:
-        return pd.DataFrame(columns=["Group", "Subsystem", "PipelineType", "StageKey", "Stage", "Count"])
-    return df
+def get_issue_age_colors(blocked_days) -> np.ndarray:
+    """Vectorized get_issue_age_color over an array of blocked days"""
+    return _AGE_ICONS_ARRAY[np.searchsorted(AGE_BINS, blocked_days, side="left")]
 
-def get_subsystem_node(data: dict, group_name: str, subsystem_name: str) -> dict | None:
-    for group in data.get("Level1Groups", []):
-        if group.get("name") == group_name:
-            for subsystem in group.get("subsystems", []):
-                if subsystem.get("name") == subsystem_name:
-                    return subsystem
-    return None
-
-def update_pipeline_counts(data: dict):
-    """Update pipeline counts based on actual pipeline details"""
-    for group in data.get("Level1Groups", []):
-        for subsystem in group.get("subsystems", []):
-            if "pipelineDetails" in subsystem:
-                for ptype in ["streaming", "batch"]:
-                    if ptype in subsystem["pipelineDetails"]:
-                        pipelines = subsystem["pipelineDetails"][ptype]
-                        counts = {"finalized": 0, "uat": 0, "planned": 0, "production": 0}
-                        
-                        for pipeline in pipelines:
-                            status = pipeline.get("status", "").lower()
-                            if status == "uat":
-                                counts["uat"] += 1
-                            elif status == "prod":
-                                counts["production"] += 1
-                            elif status == "planned":
-                                counts["planned"] += 1
-                            elif status == "blocked":
-                                counts["finalized"] += 1  # Blocked pipelines count as finalized for now
-                            else:
-                                counts["finalized"] += 1
-                        
-                        # Update the counts
-                        if "pipelines" not in subsystem:
-                            subsystem["pipelines"] = {}
-                        if ptype not in subsystem["pipelines"]:
-                            subsystem["pipelines"][ptype] = {}
-                        subsystem["pipelines"][ptype].update(counts)
+def build_subsystem_index(data: dict) -> dict:
+    """Map (group name, subsystem name) to the subsystem node for O(1) lookups"""
+    return {
+        (group.get("name"), subsystem.get("name")): subsystem
+        for group in data.get("Level1Groups", [])
+        for subsystem in group.get("subsystems", [])
+    }
+
+@st.cache_data(show_spinner=False)
+def build_navigation(data_version: float, _subsystem_index: dict) -> dict:
+    """Group names mapped to their subsystem names, in data order; cached per data file version"""
+    navigation = {}
+    for group_name, subsystem_name in _subsystem_index:
+        if group_name is None or subsystem_name is None:
+            continue
+        navigation.setdefault(group_name, []).append(subsystem_name)
+    return navigation
+
+def get_subsystem_node(subsystem_index: dict, group_name: str, subsystem_name: str) -> dict | None:
+    return subsystem_index.get((group_name, subsystem_name))
+
+def stage_totals(node: dict) -> dict:
+    """Sum pipeline counts per stage across all pipeline types of a subsystem"""
+    totals = dict.fromkeys(STAGE_DISPLAY, 0)
+    for stages in node.get("pipelines", {}).values():
+        for stage_key, count in stages.items():
+            totals[stage_key] = totals.get(stage_key, 0) + int(count or 0)
+    return totals
+
+@st.cache_data(show_spinner=False)
+def build_pipeline_type_pie(pipelines: dict) -> "go.Figure":
+    """Streaming vs batch pie for one subsystem; cached on its pipeline counts"""
+    import plotly.graph_objects as go
+
+    ptypes = list(pipelines)
+    fig = go.Figure(go.Pie(
+        labels=ptypes,
+        values=[sum(int(count or 0) for count in pipelines[ptype].values()) for ptype in ptypes],
+        marker_colors=[PIPELINE_COLORS.get(ptype) for ptype in ptypes],
+        sort=False
+    ))
+    fig.update_layout(title="Streaming vs Batch", legend_title_text="PipelineType")
+    return fig
+
+@st.cache_data(show_spinner=False)
+def build_stage_bar(pipelines: dict) -> "go.Figure":
+    """Stacked pipelines-by-stage bar for one subsystem; cached on its pipeline counts"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure([
+        go.Bar(
+            name=ptype,
+            x=[STAGE_DISPLAY.get(stage_key, stage_key.title()) for stage_key in stages],
+            y=[int(count or 0) for count in stages.values()],
+            marker_color=PIPELINE_COLORS.get(ptype)
+        )
+        for ptype, stages in pipelines.items()
+    ])
+    fig.update_layout(
+        barmode="stack",
+        title="Pipelines by Stage (Stacked)",
+        xaxis_title="Stage",
+        yaxis_title="Count",
+        legend_title_text="PipelineType"
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def subsystem_totals(data_version: float, _data: dict) -> dict:
+    """Total pipeline count per subsystem, grouped by group name; cached per data file version"""
+    return {
+        group.get("name"): {
+            subsystem.get("name"): sum(int(count or 0) for stages in subsystem.get("pipelines", {}).values()
+                                       for count in stages.values())
+            for subsystem in group.get("subsystems", [])
+        }
+        for group in _data.get("Level1Groups", [])
+    }
+
+@st.cache_data(show_spinner=False)
+def build_group_bar(group_totals: dict, group_name: str) -> "go.Figure":
+    """Total pipelines per subsystem bar for one group; cached on its subsystem totals"""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Bar(x=list(group_totals), y=list(group_totals.values())))
+    fig.update_layout(
+        title=f"Total Pipelines per Subsystem in {group_name}",
+        xaxis_title="Subsystem",
+        yaxis_title="Count"
+    )
+    return fig
+
+def _recount_subsystem(subsystem: dict):
+    """Update one subsystem's pipeline counts from its pipeline details"""
+    if "pipelineDetails" in subsystem:
+        for ptype in ["streaming", "batch"]:
+            if ptype in subsystem["pipelineDetails"]:
+                pipelines = subsystem["pipelineDetails"][ptype]
+                stage_counts = Counter(
+                    STATUS_STAGE.get(pipeline.get("status", "").lower(), "finalized") for pipeline in pipelines
+                )
+                
+                # Update the counts
+                subsystem.setdefault("pipelines", {}).setdefault(ptype, {}).update(
+                    {stage_key: stage_counts.get(stage_key, 0) for stage_key in STAGE_DISPLAY}
+                )
 
 def validate_excel_upload(df: pd.DataFrame, pipeline_type: str) -> tuple[bool, str]:
     """Validate Excel upload format"""
     if pipeline_type == "batch":
-        required_fields = list(BATCH_FIELDS.keys())
+        required_fields = list(vars(BATCH_FIELDS))
     else:
-        required_fields = list(STREAMING_FIELDS.keys())
+        required_fields = list(vars(STREAMING_FIELDS))
     
-    missing_fields = [field for field in required_fields if field not in df.columns]
+    columns = set(df.columns)
+    missing_fields = [field for field in required_fields if field not in columns]
     
     if missing_fields:
         return False, f"Missing required columns: {', '.join(missing_fields)}"
@@ -268,535 +509,441 @@ def validate_excel_upload(df: pd.DataFrame, pipeline_type: str) -> tuple[bool, s
 
 def process_excel_upload(df: pd.DataFrame, pipeline_type: str) -> list:
     """Process Excel upload and convert to pipeline objects"""
-    pipelines = []
-    
-    for _, row in df.iterrows():
-        pipeline = {}
-        for field in df.columns:
-            if pd.notna(row[field]):
-                pipeline[field] = str(row[field])
-            else:
-                pipeline[field] = ""
-        pipelines.append(pipeline)
-    
-    return pipelines
+    # Blank cells become "", everything else its string form
+    return df.astype(object).where(df.notna(), "").astype(str).to_dict(orient="records")
 
-# -------- Streamlit UI --------
-st.set_page_config(page_title="Pipeline Onboarding Dashboard", layout="wide", initial_sidebar_state="collapsed")
-st.title("Pipeline Onboarding Dashboard")
-
-# Load data and show status
-data = load_data()
-df = extract_pipelines(data)
+def _as_megabytes(value) -> float | None:
+    """Stored MB size as a float; older saves and Excel uploads hold it as a string"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
 
-# Show data source status and controls
-col1, col2 = st.columns([3, 1])
+def _build_pipeline_payload(pipeline_type: str, **values) -> dict:
+    """Stored form of one pipeline from its admin form values"""
+    if pipeline_type == "batch":
+        schedule = {
+            "frequency": values["frequency"],
+            "run_day": values["run_day"],
+            "run_timestamp": values["run_timestamp"].strftime(TIME_FMT),
+            "file_size": float(values["file_size"]),
+        }
+    else:  # streaming
+        schedule = {
+            "start_time": values["start_time"].strftime(TIME_FMT),
+            "end_time": values["end_time"].strftime(TIME_FMT),
+            "run_day": values["run_day"],
+            "rough_volume": float(values["rough_volume"]),
+        }
+    return {
+        "pipeline_name": values["pipeline_name"],
+        "data_name": values["data_name"],
+        **schedule,
+        "uat_date": values["uat_date"].strftime(DATE_FMT) if values["uat_date"] else "",
+        "prod_date": values["prod_date"].strftime(DATE_FMT) if values["prod_date"] else "",
+        "status": values["status"],
+        "comment": values["comment"],
+    }
 
-with col1:
-    if os.path.exists("data.json"):
-        file_stats = os.stat("data.json")
-        st.info(f"Data loaded from: data.json (Last modified: {pd.Timestamp(file_stats.st_mtime, unit='s').strftime('%Y-%m-%d %H:%M:%S')})")
-    else:
-        st.info("Using default data (data.json will be created on first save)")
+@lru_cache(maxsize=256)
+def admin_widget_keys(subsystem: str, pipeline_type: str) -> dict:
+    """Widget keys for the admin forms and action buttons of one subsystem and pipeline type"""
+    keys = {
+        "edit_selected": f"edit_selected_{pipeline_type}_{subsystem}",
+        "delete_selected": f"delete_selected_{pipeline_type}_{subsystem}",
+    }
+    for action in ("batch_form", "stream_form",
+                   "edit_selected_issue", "delete_selected_issue",
+                   "issue_form"):
+        keys[action] = f"{action}_{subsystem}"
+    return keys
 
-with col2:
-    if st.button("Refresh Data", key="refresh_dashboard_main"):
+def rerun_admin_panel():
+    """Rerun only the admin fragment; falls back to a full rerun when it is running as part of one"""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
         st.rerun()
 
-# Initialize session state for tracking changes
-if 'data_modified' not in st.session_state:
-    st.session_state.data_modified = False
-
-# Sidebar navigation
-st.sidebar.title("Navigation")
-tab_selection = st.sidebar.radio("Select Tab", ["Dashboard", "Admin"])
-
-# Sidebar filters populated from data
-groups = df["Group"].dropna().unique()
-selected_group = st.sidebar.selectbox("Select Level-1 Group", groups)
-subsystems = df[df["Group"] == selected_group]["Subsystem"].dropna().unique()
-selected_subsystem = st.sidebar.selectbox("Select Subsystem", subsystems)
+@st.fragment
+def render_admin_panel(selected_group: str, selected_subsystem: str):
+    """Admin editors for one subsystem; widget changes rerun only this fragment"""
+    # Reload on every fragment run: saves then start from the latest file rather than
+    # the last full run's copy, and a failed background write is reported in this session
+    data, _ = load_data()
+    node = get_subsystem_node(build_subsystem_index(data), selected_group, selected_subsystem)
+    if node is None:
+        st.warning(f"{selected_subsystem} no longer exists in {selected_group}.")
+        return
 
-sub_df = df[(df["Group"] == selected_group) & (df["Subsystem"] == selected_subsystem)]
+    # One clock read per run, shared by every widget default below
+    now = datetime.now()
+    today = now.date()
 
-if sub_df.empty:
-    st.warning("No pipeline records found. Please check your data source.")
-    st.stop()
+    st.subheader(f"Edit {selected_subsystem} Details")
 
-# Dashboard Tab
-if tab_selection == "Dashboard":
-    st.header("Dashboard View")
+    # Pipeline Management Section
+    st.subheader("Pipeline Management")
     
-    # Summary Metrics
-    col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Finalized", int(sub_df[sub_df["StageKey"] == "finalized"]["Count"].sum()))
-    col2.metric("UAT", int(sub_df[sub_df["StageKey"] == "uat"]["Count"].sum()))
-    col3.metric("Planned", int(sub_df[sub_df["StageKey"] == "planned"]["Count"].sum()))
-    col4.metric("Production", int(sub_df[sub_df["StageKey"] == "production"]["Count"].sum()))
-
-    # Charts
-    colA, colB = st.columns(2)
-    fig1 = px.pie(sub_df, values="Count", names="PipelineType", title="Streaming vs Batch",
-                  color_discrete_map=PIPELINE_COLORS)
-    colA.plotly_chart(fig1, use_container_width=True)
-    fig2 = px.bar(
-        sub_df,
-        x="Stage",
-        y="Count",
-        color="PipelineType",
-        barmode="stack",
-        title="Pipelines by Stage (Stacked)",
-        color_discrete_map=PIPELINE_COLORS
-    )
-    colB.plotly_chart(fig2, use_container_width=True)
-
-    group_df = df[df["Group"] == selected_group].groupby(["Subsystem"])['Count'].sum().reset_index()
-    st.plotly_chart(
-        px.bar(group_df, x="Subsystem", y="Count", title=f"Total Pipelines per Subsystem in {selected_group}"),
-        use_container_width=True
-    )
-
-    # Issues Summary Table (Read-only view)
-    node = get_subsystem_node(data, selected_group, selected_subsystem)
-    if node and node.get("issues"):
-        st.header("Issues Overview")
+    # Pipeline Type Selection
+    pipeline_type = st.selectbox("Select Pipeline Type", ["batch", "streaming"], key="pipeline_type_select")
+    widget_keys = admin_widget_keys(selected_subsystem, pipeline_type)
+    
+    # Show existing pipelines
+    if "pipelineDetails" not in node:
+        node["pipelineDetails"] = {"streaming": [], "batch": []}
+    
+    existing_pipelines = node["pipelineDetails"].get(pipeline_type, [])
+    
+    # Display existing pipelines in a table with action columns
+    if existing_pipelines:
+        st.markdown(f"**Existing {pipeline_type.title()} Pipelines ({len(existing_pipelines)}):**")
         
-        # Prepare data for the table
-        summary_data = []
-        for issue in node.get("issues", []):
-            start_date_str = issue.get("start_date", "")
-            close_date_str = issue.get("close_date", "")
-            blocked_days = calculate_blocked_days(start_date_str, close_date_str)
-            
-            # Get age-based color indicator
-            age_color = get_issue_age_color(blocked_days)
-            
-            summary_data.append({
-                "Issue ID": issue["id"],
-                "Description": issue["description"][:50] + "..." if len(issue["description"]) > 50 else issue["description"],
-                "Status": issue["status"],
-                "Start Date": format_date_display(start_date_str),
-                "Close Date": format_date_display(close_date_str),
-                "Blocked Days": blocked_days,
-                "Age Indicator": age_color,
-                "Status": "Closed" if issue["status"] == "Closed" else "In Progress" if issue["status"] == "In Progress" else "Open"
-            })
+        # Create table data for display
+        table_data = []
+        for idx, pipeline in enumerate(existing_pipelines):
+            if pipeline_type == "batch":
+                table_data.append({
+                    "ID": idx,
+                    "Pipeline Name": pipeline.get('pipeline_name', 'N/A'),
+                    "Data Name": pipeline.get('data_name', 'N/A'),
+                    "Frequency": pipeline.get('frequency', 'N/A'),
+                    "Run Day": pipeline.get('run_day', 'N/A'),
+                    "Run Time": pipeline.get('run_timestamp', 'N/A'),
+                    "File Size (MB)": _as_megabytes(pipeline.get('file_size')),
+                    "Status": pipeline.get('status', 'N/A'),
+                    "UAT Date": pipeline.get('uat_date', 'N/A'),
+                    "PROD Date": pipeline.get('prod_date', 'N/A')
+                })
+            else:  # streaming
+                table_data.append({
+                    "ID": idx,
+                    "Pipeline Name": pipeline.get('pipeline_name', 'N/A'),
+                    "Data Name": pipeline.get('data_name', 'N/A'),
+                    "Start Time": pipeline.get('start_time', 'N/A'),
+                    "End Time": pipeline.get('end_time', 'N/A'),
+                    "Run Day": pipeline.get('run_day', 'N/A'),
+                    "Volume (MB)": _as_megabytes(pipeline.get('rough_volume')),
+                    "Status": pipeline.get('status', 'N/A'),
+                    "UAT Date": pipeline.get('uat_date', 'N/A'),
+                    "PROD Date": pipeline.get('prod_date', 'N/A')
+                })
         
-        # Create summary DataFrame
-        summary_df = pd.DataFrame(summary_data)
+        # Display table with built-in sorting and searching
+        table_df = pd.DataFrame(table_data)
         
-        # Display the table with styling
-        st.dataframe(
-            summary_df,
-            column_config={
-                "Age Indicator": st.column_config.TextColumn("Age", help="Recent (≤7 days), Moderate (8-30 days), Old (>30 days)"),
-                "Status": st.column_config.TextColumn("Status", help="Closed, In Progress, Open"),
-                "Blocked Days": st.column_config.NumberColumn("Days Blocked", help="Total days from start to close (or today if open)")
-            },
+        # Use st.dataframe with enhanced features
+        event = st.dataframe(
+            table_df,
+            use_container_width=True,
             hide_index=True,
-            use_container_width=True
+            on_select="rerun",
+            selection_mode="single-row"
         )
         
-        # Summary statistics
-        total_open = len([i for i in node.get("issues", []) if i["status"] == "Open"])
-        total_in_progress = len([i for i in node.get("issues", []) if i["status"] == "In Progress"])
-        total_closed = len([i for i in node.get("issues", []) if i["status"] == "Closed"])
-        total_blocked_days = sum([calculate_blocked_days(i.get("start_date", ""), i.get("close_date", "")) for i in node.get("issues", [])])
-        
-        col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Open Issues", total_open)
-        col2.metric("In Progress", total_in_progress)
-        col3.metric("Closed", total_closed)
-        col4.metric("Total Blocked Days", total_blocked_days)
-
-# Admin Tab
-elif tab_selection == "Admin":
-    st.header("Admin Panel")
-    st.info("Use this panel to edit pipeline data, contacts, and issues.")
-    
-    node = get_subsystem_node(data, selected_group, selected_subsystem)
-    if node:
-        st.subheader(f"Edit {selected_subsystem} Details")
-
-        # Pipeline Management Section
-        st.subheader("Pipeline Management")
-        
-        # Pipeline Type Selection
-        pipeline_type = st.selectbox("Select Pipeline Type", ["batch", "streaming"], key="pipeline_type_select")
-        
-        # Show existing pipelines
-        if "pipelineDetails" not in node:
-            node["pipelineDetails"] = {"streaming": [], "batch": []}
-        
-        existing_pipelines = node["pipelineDetails"].get(pipeline_type, [])
-        
-        # Display existing pipelines in a table with action columns
-        if existing_pipelines:
-            st.markdown(f"**Existing {pipeline_type.title()} Pipelines ({len(existing_pipelines)}):**")
-            
-            # Create table data for display
-            table_data = []
-            for idx, pipeline in enumerate(existing_pipelines):
-                if pipeline_type == "batch":
-                    table_data.append({
-                        "ID": idx,
-                        "Pipeline Name": pipeline.get('pipeline_name', 'N/A'),
-                        "Data Name": pipeline.get('data_name', 'N/A'),
-                        "Frequency": pipeline.get('frequency', 'N/A'),
-                        "Run Day": pipeline.get('run_day', 'N/A'),
-                        "Run Time": pipeline.get('run_timestamp', 'N/A'),
-                        "File Size (MB)": pipeline.get('file_size', 'N/A'),
-                        "Status": pipeline.get('status', 'N/A'),
-                        "UAT Date": pipeline.get('uat_date', 'N/A'),
-                        "PROD Date": pipeline.get('prod_date', 'N/A')
-                    })
-                else:  # streaming
-                    table_data.append({
-                        "ID": idx,
-                        "Pipeline Name": pipeline.get('pipeline_name', 'N/A'),
-                        "Data Name": pipeline.get('data_name', 'N/A'),
-                        "Start Time": pipeline.get('start_time', 'N/A'),
-                        "End Time": pipeline.get('end_time', 'N/A'),
-                        "Run Day": pipeline.get('run_day', 'N/A'),
-                        "Volume (MB)": pipeline.get('rough_volume', 'N/A'),
-                        "Status": pipeline.get('status', 'N/A'),
-                        "UAT Date": pipeline.get('uat_date', 'N/A'),
-                        "PROD Date": pipeline.get('prod_date', 'N/A')
-                    })
+        # Action buttons for selected row
+        if event.selection.rows:
+            selected_idx = event.selection.rows[0]
+            selected_pipeline = existing_pipelines[selected_idx]
             
-            # Display table with built-in sorting and searching
-            table_df = pd.DataFrame(table_data)
+            col1, col2, col3 = st.columns([1, 1, 6])
             
-            # Use st.dataframe with enhanced features
-            event = st.dataframe(
-                table_df,
-                use_container_width=True,
-                hide_index=True,
-                on_select="rerun",
-                selection_mode="single-row"
-            )
+            with col1:
+                if st.button("✏️ Edit Selected", type="primary", key=widget_keys["edit_selected"]):
+                    st.session_state.edit_pipeline = {
+                        'index': selected_idx,
+                        'type': pipeline_type,
+                        'data': selected_pipeline
+                    }
+                    rerun_admin_panel()
             
-            # Action buttons for selected row
-            if event.selection.rows:
-                selected_idx = event.selection.rows[0]
-                selected_pipeline = existing_pipelines[selected_idx]
-                
-                col1, col2, col3 = st.columns([1, 1, 6])
-                
-                with col1:
-                    if st.button("✏️ Edit Selected", type="primary", key=f"edit_selected_{pipeline_type}_{selected_subsystem}"):
-                        st.session_state.edit_pipeline = {
-                            'index': selected_idx,
-                            'type': pipeline_type,
-                            'data': selected_pipeline
-                        }
-                        st.rerun()
-                
-                with col2:
-                    if st.button("🗑️ Delete Selected", type="secondary", key=f"delete_selected_{pipeline_type}_{selected_subsystem}"):
-                        # Remove the pipeline
-                        node["pipelineDetails"][pipeline_type].pop(selected_idx)
-                        update_pipeline_counts(data)
-                        # Save immediately so the deletion persists
-                        if save_data(data):
-                            st.success(f"Pipeline {selected_pipeline.get('pipeline_name', 'Unknown')} deleted!")
-                        else:
-                            st.error("Failed to delete pipeline. Please try again.")
-                        st.rerun()
-        else:
-            st.info(f"No {pipeline_type.title()} pipelines found. Add your first pipeline below!")
-        
-        # Add New Pipeline Section
-        st.markdown("---")
-        st.subheader("Add New Pipeline")
-        
-        # Check if we're editing an existing pipeline
-        editing_pipeline = st.session_state.get('edit_pipeline', None)
-        is_editing = editing_pipeline and editing_pipeline['type'] == pipeline_type
-        
-        if is_editing:
-            st.info(f"Editing pipeline: {editing_pipeline['data'].get('pipeline_name', 'Unknown')}")
-            pipeline_data = editing_pipeline['data']
-        else:
-            pipeline_data = {}
-        
-        # Single Pipeline Addition
-        with st.expander("Add Single Pipeline", expanded=True):
-            if pipeline_type == "batch":
+            with col2:
+                if st.button("🗑️ Delete Selected", type="secondary", key=widget_keys["delete_selected"]):
+                    # Remove the pipeline
+                    node["pipelineDetails"][pipeline_type].pop(selected_idx)
+                    _recount_subsystem(node)
+                    # Save immediately so the deletion persists
+                    if save_data(data):
+                        st.success(f"Pipeline {selected_pipeline.get('pipeline_name', 'Unknown')} deleted!")
+                    else:
+                        st.error("Failed to delete pipeline. Please try again.")
+                    rerun_admin_panel()
+    else:
+        st.info(f"No {pipeline_type.title()} pipelines found. Add your first pipeline below!")
+    
+    # Add New Pipeline Section
+    st.markdown("---")
+    st.subheader("Add New Pipeline")
+    
+    # Check if we're editing an existing pipeline
+    editing_pipeline = st.session_state.get('edit_pipeline', None)
+    is_editing = editing_pipeline and editing_pipeline['type'] == pipeline_type
+    
+    if is_editing:
+        st.info(f"Editing pipeline: {editing_pipeline['data'].get('pipeline_name', 'Unknown')}")
+        pipeline_data = editing_pipeline['data']
+    else:
+        pipeline_data = {}
+    
+    # Stored times and dates behind the form defaults, read once
+    saved_run_timestamp = pipeline_data.get('run_timestamp')
+    saved_start_time = pipeline_data.get('start_time')
+    saved_end_time = pipeline_data.get('end_time')
+    saved_uat_date = pipeline_data.get('uat_date')
+    saved_prod_date = pipeline_data.get('prod_date')
+    
+    # Single Pipeline Addition
+    with st.expander("Add Single Pipeline", expanded=True):
+        if pipeline_type == "batch":
+            with st.form(widget_keys["batch_form"], clear_on_submit=False):
                 col1, col2 = st.columns(2)
                 with col1:
                     pipeline_name = st.text_input("Pipeline Name*", value=pipeline_data.get('pipeline_name', ''), 
-                                                help=BATCH_FIELDS["pipeline_name"], key="new_batch_name")
+                                                help=BATCH_FIELDS.pipeline_name, key="new_batch_name")
                     data_name = st.text_input("Data Name*", value=pipeline_data.get('data_name', ''), 
-                                            help=BATCH_FIELDS["data_name"], key="new_batch_data")
+                                            help=BATCH_FIELDS.data_name, key="new_batch_data")
                     frequency = st.selectbox("Frequency*", ["daily", "weekly", "monthly"], 
                                           index=["daily", "weekly", "monthly"].index(pipeline_data.get('frequency', 'daily')), 
-                                          help=BATCH_FIELDS["frequency"], key="new_batch_freq")
+                                          help=BATCH_FIELDS.frequency, key="new_batch_freq")
                     run_day = st.text_input("Run Day*", value=pipeline_data.get('run_day', ''), 
-                                          placeholder="e.g., Monday, 1st", help=BATCH_FIELDS["run_day"], key="new_batch_day")
+                                          placeholder="e.g., Monday, 1st", help=BATCH_FIELDS.run_day, key="new_batch_day")
                     run_timestamp = st.time_input("Run Timestamp*", 
-                                                value=datetime.strptime(pipeline_data.get('run_timestamp', '00:00'), '%H:%M').time() if pipeline_data.get('run_timestamp') else datetime.now().time(), 
-                                                help=BATCH_FIELDS["run_timestamp"], key="new_batch_time")
+                                                value=_parse_time(saved_run_timestamp) if saved_run_timestamp else now.time(), 
+                                                help=BATCH_FIELDS.run_timestamp, key="new_batch_time")
                     file_size = st.number_input("File Size (MB)*", min_value=0.0, step=0.1, 
-                                              value=float(pipeline_data.get('file_size', 0.0)), 
-                                              help=BATCH_FIELDS["file_size"], key="new_batch_size")
-                
+                                              value=_as_megabytes(pipeline_data.get('file_size')) or 0.0, 
+                                              help=BATCH_FIELDS.file_size, key="new_batch_size")
+            
                 with col2:
                     uat_date = st.date_input("UAT Date", 
-                                           value=datetime.strptime(pipeline_data.get('uat_date', '2025-01-01'), '%Y-%m-%d').date() if pipeline_data.get('uat_date') else datetime.now().date(), 
-                                           help=BATCH_FIELDS["uat_date"], key="new_batch_uat")
+                                           value=_parse_date(saved_uat_date) if saved_uat_date else today, 
+                                           help=BATCH_FIELDS.uat_date, key="new_batch_uat")
                     prod_date = st.date_input("PROD Date", 
-                                            value=datetime.strptime(pipeline_data.get('prod_date', '2025-01-01'), '%Y-%m-%d').date() if pipeline_data.get('prod_date') else datetime.now().date(), 
-                                            help=BATCH_FIELDS["prod_date"], key="new_batch_prod")
-                    status = st.selectbox("Status*", ["Planned", "UAT", "PROD", "Blocked"], 
-                                       index=["Planned", "UAT", "PROD", "Blocked"].index(pipeline_data.get('status', 'Planned')), 
-                                       help=BATCH_FIELDS["status"], key="new_batch_status")
+                                            value=_parse_date(saved_prod_date) if saved_prod_date else today, 
+                                            help=BATCH_FIELDS.prod_date, key="new_batch_prod")
+                    status = st.radio("Status*", STATUS_OPTIONS, horizontal=True, 
+                                  index=STATUS_INDEX.get(pipeline_data.get('status'), 0), 
+                                  help=BATCH_FIELDS.status, key="new_batch_status")
                     comment = st.text_area("Comment", value=pipeline_data.get('comment', ''), 
-                                         help=BATCH_FIELDS["comment"], key="new_batch_comment")
+                                         help=BATCH_FIELDS.comment, key="new_batch_comment")
+            
+                values = dict(
+                    pipeline_name=pipeline_name, data_name=data_name, frequency=frequency,
+                    run_day=run_day, run_timestamp=run_timestamp, file_size=file_size,
+                    uat_date=uat_date, prod_date=prod_date, status=status, comment=comment,
+                )
+                payload = _build_pipeline_payload(pipeline_type, **values)
+                missing = [label for field, label in REQUIRED_BATCH.items() if not values[field]]
                 
                 if is_editing:
                     col1, col2 = st.columns(2)
                     with col1:
-                        if st.button("Update Pipeline", key=f"update_batch_{selected_subsystem}", type="primary"):
-                            if pipeline_name and data_name and frequency and run_day and file_size:
+                        if st.form_submit_button("Update Pipeline", type="primary"):
+                            if not missing:
                                 # Update existing pipeline
-                                node["pipelineDetails"][pipeline_type][editing_pipeline['index']] = {
-                                    "pipeline_name": pipeline_name,
-                                    "data_name": data_name,
-                                    "frequency": frequency,
-                                    "run_day": run_day,
-                                    "run_timestamp": run_timestamp.strftime("%H:%M"),
-                                    "file_size": str(file_size),
-                                    "uat_date": uat_date.strftime("%Y-%m-%d") if uat_date else "",
-                                    "prod_date": prod_date.strftime("%Y-%m-%d") if prod_date else "",
-                                    "status": status,
-                                    "comment": comment
-                                }
-                                update_pipeline_counts(data)
+                                node["pipelineDetails"][pipeline_type][editing_pipeline['index']] = payload
+                                _recount_subsystem(node)
                                 # Clear edit mode
-                                if 'edit_pipeline' in st.session_state:
-                                    del st.session_state.edit_pipeline
+                                st.session_state.pop('edit_pipeline', None)
                                 # Save immediately so the update persists
                                 if save_data(data):
-                                    st.success(f"Pipeline updated!")
+                                    st.success(MSG_PIPELINE_UPDATED)
                                 else:
-                                    st.error("Failed to update pipeline. Please try again.")
-                                st.rerun()
+                                    st.error(MSG_PIPELINE_UPDATE_FAILED)
+                                rerun_admin_panel()
                             else:
-                                st.error("Please fill in all required fields (marked with *)")
-                    
+                                st.error(f"{MSG_REQUIRED}: {', '.join(missing)}")
+                
                     with col2:
-                        if st.button("Cancel Edit", key=f"cancel_batch_{selected_subsystem}", type="secondary"):
-                            if 'edit_pipeline' in st.session_state:
-                                del st.session_state.edit_pipeline
+                        if st.form_submit_button("Cancel Edit", type="secondary"):
+                            st.session_state.pop('edit_pipeline', None)
                             st.rerun()
                 else:
-                    if st.button("Add Batch Pipeline", key=f"add_batch_{selected_subsystem}", type="primary"):
-                        if pipeline_name and data_name and frequency and run_day and file_size:
-                            new_pipeline = {
-                                "pipeline_name": pipeline_name,
-                                "data_name": data_name,
-                                "frequency": frequency,
-                                "run_day": run_day,
-                                "run_timestamp": run_timestamp.strftime("%H:%M"),
-                                "file_size": str(file_size),
-                                "uat_date": uat_date.strftime("%Y-%m-%d") if uat_date else "",
-                                "prod_date": prod_date.strftime("%Y-%m-%d") if prod_date else "",
-                                "status": status,
-                                "comment": comment
-                            }
-                            node["pipelineDetails"][pipeline_type].append(new_pipeline)
-                            update_pipeline_counts(data)
+                    if st.form_submit_button("Add Batch Pipeline", type="primary"):
+                        if missing:
+                            st.error(f"{MSG_REQUIRED}: {', '.join(missing)}")
+                        elif payload in node["pipelineDetails"][pipeline_type]:
+                            # A repeated submit of the same form; don't store or save it twice
+                            st.warning(f"Pipeline {pipeline_name} already exists with these details; duplicate ignored")
+                        else:
+                            node["pipelineDetails"][pipeline_type].append(payload)
+                            _recount_subsystem(node)
                             # Save immediately so the pipeline persists after rerun
                             if save_data(data):
-                                st.success(f"Added new {pipeline_type} pipeline: {pipeline_name}")
+                                st.success(MSG_PIPELINE_ADDED(pipeline_type, pipeline_name))
                             else:
-                                st.error("Failed to save pipeline. Please try again.")
-                            st.rerun()
-                        else:
-                            st.error("Please fill in all required fields (marked with *)")
-            
-            else:  # streaming
+                                st.error(MSG_PIPELINE_SAVE_FAILED)
+                            rerun_admin_panel()
+        
+        else:  # streaming
+            with st.form(widget_keys["stream_form"], clear_on_submit=False):
                 col1, col2 = st.columns(2)
                 with col1:
                     pipeline_name = st.text_input("Pipeline Name*", value=pipeline_data.get('pipeline_name', ''), 
-                                                help=STREAMING_FIELDS["pipeline_name"], key="new_stream_name")
+                                                help=STREAMING_FIELDS.pipeline_name, key="new_stream_name")
                     data_name = st.text_input("Data Name*", value=pipeline_data.get('data_name', ''), 
-                                            help=STREAMING_FIELDS["data_name"], key="new_stream_data")
+                                            help=STREAMING_FIELDS.data_name, key="new_stream_data")
                     start_time = st.time_input("Start Time*", 
-                                             value=datetime.strptime(pipeline_data.get('start_time', '00:00'), '%H:%M').time() if pipeline_data.get('start_time') else datetime.now().time(), 
-                                             help=STREAMING_FIELDS["start_time"], key="new_stream_start")
+                                             value=_parse_time(saved_start_time) if saved_start_time else now.time(), 
+                                             help=STREAMING_FIELDS.start_time, key="new_stream_start")
                     end_time = st.time_input("End Time*", 
-                                           value=datetime.strptime(pipeline_data.get('end_time', '23:59'), '%H:%M').time() if pipeline_data.get('end_time') else datetime.now().time(), 
-                                           help=STREAMING_FIELDS["end_time"], key="new_stream_end")
+                                           value=_parse_time(saved_end_time) if saved_end_time else now.time(), 
+                                           help=STREAMING_FIELDS.end_time, key="new_stream_end")
                     run_day = st.text_input("Run Day*", value=pipeline_data.get('run_day', ''), 
-                                          placeholder="e.g., Monday, 1st", help=STREAMING_FIELDS["run_day"], key="new_stream_day")
+                                          placeholder="e.g., Monday, 1st", help=STREAMING_FIELDS.run_day, key="new_stream_day")
                     rough_volume = st.number_input("Volume (MB)*", min_value=0.0, step=0.1, 
-                                                 value=float(pipeline_data.get('rough_volume', 0.0)), 
-                                                 help=STREAMING_FIELDS["rough_volume"], key="new_stream_volume")
-                
+                                                 value=_as_megabytes(pipeline_data.get('rough_volume')) or 0.0, 
+                                                 help=STREAMING_FIELDS.rough_volume, key="new_stream_volume")
+            
                 with col2:
                     uat_date = st.date_input("UAT Date", 
-                                           value=datetime.strptime(pipeline_data.get('uat_date', '2025-01-01'), '%Y-%m-%d').date() if pipeline_data.get('uat_date') else datetime.now().date(), 
-                                           help=STREAMING_FIELDS["uat_date"], key="new_stream_uat")
+                                           value=_parse_date(saved_uat_date) if saved_uat_date else today, 
+                                           help=STREAMING_FIELDS.uat_date, key="new_stream_uat")
                     prod_date = st.date_input("PROD Date", 
-                                            value=datetime.strptime(pipeline_data.get('prod_date', '2025-01-01'), '%Y-%m-%d').date() if pipeline_data.get('prod_date') else datetime.now().date(), 
-                                            help=STREAMING_FIELDS["prod_date"], key="new_stream_prod")
-                    status = st.selectbox("Status*", ["Planned", "UAT", "PROD", "Blocked"], 
-                                       index=["Planned", "UAT", "PROD", "Blocked"].index(pipeline_data.get('status', 'Planned')), 
-                                       help=STREAMING_FIELDS["status"], key="new_stream_status")
+                                            value=_parse_date(saved_prod_date) if saved_prod_date else today, 
+                                            help=STREAMING_FIELDS.prod_date, key="new_stream_prod")
+                    status = st.radio("Status*", STATUS_OPTIONS, horizontal=True, 
+                                  index=STATUS_INDEX.get(pipeline_data.get('status'), 0), 
+                                  help=STREAMING_FIELDS.status, key="new_stream_status")
                     comment = st.text_area("Comment", value=pipeline_data.get('comment', ''), 
-                                         help=STREAMING_FIELDS["comment"], key="new_stream_comment")
+                                         help=STREAMING_FIELDS.comment, key="new_stream_comment")
+            
+                values = dict(
+                    pipeline_name=pipeline_name, data_name=data_name, start_time=start_time,
+                    end_time=end_time, run_day=run_day, rough_volume=rough_volume,
+                    uat_date=uat_date, prod_date=prod_date, status=status, comment=comment,
+                )
+                payload = _build_pipeline_payload(pipeline_type, **values)
+                missing = [label for field, label in REQUIRED_STREAM.items() if not values[field]]
                 
                 if is_editing:
                     col1, col2 = st.columns(2)
                     with col1:
-                        if st.button("Update Pipeline", key=f"update_stream_{selected_subsystem}", type="primary"):
-                            if pipeline_name and data_name and start_time and end_time and run_day and rough_volume:
+                        if st.form_submit_button("Update Pipeline", type="primary"):
+                            if not missing:
                                 # Update existing pipeline
-                                node["pipelineDetails"][pipeline_type][editing_pipeline['index']] = {
-                                    "pipeline_name": pipeline_name,
-                                    "data_name": data_name,
-                                    "start_time": start_time.strftime("%H:%M"),
-                                    "end_time": end_time.strftime("%H:%M"),
-                                    "run_day": run_day,
-                                    "rough_volume": str(rough_volume),
-                                    "uat_date": uat_date.strftime("%Y-%m-%d") if uat_date else "",
-                                    "prod_date": prod_date.strftime("%Y-%m-%d") if prod_date else "",
-                                    "status": status,
-                                    "comment": comment
-                                }
-                                update_pipeline_counts(data)
+                                node["pipelineDetails"][pipeline_type][editing_pipeline['index']] = payload
+                                _recount_subsystem(node)
                                 # Clear edit mode
-                                if 'edit_pipeline' in st.session_state:
-                                    del st.session_state.edit_pipeline
+                                st.session_state.pop('edit_pipeline', None)
                                 # Save immediately so the update persists
                                 if save_data(data):
-                                    st.success(f"Pipeline updated!")
+                                    st.success(MSG_PIPELINE_UPDATED)
                                 else:
-                                    st.error("Failed to update pipeline. Please try again.")
-                                st.rerun()
+                                    st.error(MSG_PIPELINE_UPDATE_FAILED)
+                                rerun_admin_panel()
                             else:
-                                st.error("Please fill in all required fields (marked with *)")
-                    
+                                st.error(f"{MSG_REQUIRED}: {', '.join(missing)}")
+                
                     with col2:
-                        if st.button("Cancel Edit", key=f"cancel_stream_{selected_subsystem}", type="secondary"):
-                            if 'edit_pipeline' in st.session_state:
-                                del st.session_state.edit_pipeline
+                        if st.form_submit_button("Cancel Edit", type="secondary"):
+                            st.session_state.pop('edit_pipeline', None)
                             st.rerun()
                 else:
-                    if st.button("Add Streaming Pipeline", key=f"add_stream_{selected_subsystem}", type="primary"):
-                        if pipeline_name and data_name and start_time and end_time and run_day and rough_volume:
-                            new_pipeline = {
-                                "pipeline_name": pipeline_name,
-                                "data_name": data_name,
-                                "start_time": start_time.strftime("%H:%M"),
-                                "end_time": end_time.strftime("%H:%M"),
-                                "run_day": run_day,
-                                "rough_volume": str(rough_volume),
-                                "uat_date": uat_date.strftime("%Y-%m-%d") if uat_date else "",
-                                "prod_date": prod_date.strftime("%Y-%m-%d") if prod_date else "",
-                                "status": status,
-                                "comment": comment
-                            }
-                            node["pipelineDetails"][pipeline_type].append(new_pipeline)
-                            update_pipeline_counts(data)
+                    if st.form_submit_button("Add Streaming Pipeline", type="primary"):
+                        if missing:
+                            st.error(f"{MSG_REQUIRED}: {', '.join(missing)}")
+                        elif payload in node["pipelineDetails"][pipeline_type]:
+                            # A repeated submit of the same form; don't store or save it twice
+                            st.warning(f"Pipeline {pipeline_name} already exists with these details; duplicate ignored")
+                        else:
+                            node["pipelineDetails"][pipeline_type].append(payload)
+                            _recount_subsystem(node)
                             # Save immediately so the pipeline persists after rerun
                             if save_data(data):
-                                st.success(f"Added new {pipeline_type} pipeline: {pipeline_name}")
+                                st.success(MSG_PIPELINE_ADDED(pipeline_type, pipeline_name))
                             else:
-                                st.error("Failed to save pipeline. Please try again.")
-                            st.rerun()
-                        else:
-                            st.error("Please fill in all required fields (marked with *)")
-         
-        # Issues Management Section
-        st.markdown("---")
-        st.subheader("Issues Management")
+                                st.error(MSG_PIPELINE_SAVE_FAILED)
+                            rerun_admin_panel()
+     
+    # Issues Management Section
+    st.markdown("---")
+    st.subheader("Issues Management")
+    
+    # Show existing issues
+    existing_issues = node.get("issues", [])
+    
+    if existing_issues:
+        st.markdown(f"**Existing Issues ({len(existing_issues)}):**")
         
-        # Show existing issues
-        existing_issues = node.get("issues", [])
+        # Create issues table data for display
+        issues_table_data = []
+        for idx, issue in enumerate(existing_issues):
+            blocked_days = calculate_blocked_days(issue.get('start_date', ''), issue.get('close_date', ''), today)
+            issues_table_data.append({
+                "ID": idx,
+                "Issue ID": issue.get('id', 'N/A'),
+                "Description": issue.get('description', 'N/A'),
+                "Status": issue.get('status', 'N/A'),
+                "Start Date": format_date_display(issue.get('start_date', '')),
+                "Close Date": format_date_display(issue.get('close_date', '')),
+                "Blocked Days": blocked_days,
+                "Age Indicator": get_issue_age_color(blocked_days)
+            })
         
-        if existing_issues:
-            st.markdown(f"**Existing Issues ({len(existing_issues)}):**")
-            
-            # Create issues table data for display
-            issues_table_data = []
-            for idx, issue in enumerate(existing_issues):
-                blocked_days = calculate_blocked_days(issue.get('start_date', ''), issue.get('close_date', ''))
-                issues_table_data.append({
-                    "ID": idx,
-                    "Issue ID": issue.get('id', 'N/A'),
-                    "Description": issue.get('description', 'N/A'),
-                    "Status": issue.get('status', 'N/A'),
-                    "Start Date": format_date_display(issue.get('start_date', '')),
-                    "Close Date": format_date_display(issue.get('close_date', '')),
-                    "Blocked Days": blocked_days,
-                    "Age Indicator": get_issue_age_color(blocked_days)
-                })
+        # Display issues table with built-in sorting and searching
+        issues_df = pd.DataFrame(issues_table_data)
+        
+        # Use st.dataframe with enhanced features
+        issues_event = st.dataframe(
+            issues_df,
+            use_container_width=True,
+            hide_index=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            column_config={
+                "Age Indicator": st.column_config.TextColumn("Age", help="Recent (≤7 days), Moderate (8-30 days), Old (>30 days)"),
+                "Blocked Days": st.column_config.NumberColumn("Days Blocked", help="Total days from start to close (or today if open)")
+            }
+        )
+        
+        # Action buttons for selected issue
+        if issues_event.selection.rows:
+            selected_issue_idx = issues_event.selection.rows[0]
+            selected_issue = existing_issues[selected_issue_idx]
             
-            # Display issues table with built-in sorting and searching
-            issues_df = pd.DataFrame(issues_table_data)
+            col1, col2, col3 = st.columns([1, 1, 6])
             
-            # Use st.dataframe with enhanced features
-            issues_event = st.dataframe(
-                issues_df,
-                use_container_width=True,
-                hide_index=True,
-                on_select="rerun",
-                selection_mode="single-row",
-                column_config={
-                    "Age Indicator": st.column_config.TextColumn("Age", help="Recent (≤7 days), Moderate (8-30 days), Old (>30 days)"),
-                    "Blocked Days": st.column_config.NumberColumn("Days Blocked", help="Total days from start to close (or today if open)")
-                }
-            )
+            with col1:
+                if st.button("✏️ Edit Selected Issue", type="primary", key=widget_keys["edit_selected_issue"]):
+                    st.session_state.edit_issue = {
+                        'index': selected_issue_idx,
+                        'data': selected_issue
+                    }
+                    rerun_admin_panel()
             
-            # Action buttons for selected issue
-            if issues_event.selection.rows:
-                selected_issue_idx = issues_event.selection.rows[0]
-                selected_issue = existing_issues[selected_issue_idx]
-                
-                col1, col2, col3 = st.columns([1, 1, 6])
-                
-                with col1:
-                    if st.button("✏️ Edit Selected Issue", type="primary", key=f"edit_selected_issue_{selected_subsystem}"):
-                        st.session_state.edit_issue = {
-                            'index': selected_issue_idx,
-                            'data': selected_issue
-                        }
-                        st.rerun()
-                
-                with col2:
-                    if st.button("🗑️ Delete Selected Issue", type="secondary", key=f"delete_selected_issue_{selected_subsystem}"):
-                        # Remove the issue
-                        node["issues"].pop(selected_issue_idx)
-                        # Save immediately so the deletion persists
-                        if save_data(data):
-                            st.success(f"Issue {selected_issue.get('id', 'Unknown')} deleted!")
-                        else:
-                            st.error("Failed to delete issue. Please try again.")
-                        st.rerun()
-        else:
-            st.info("No issues found. Add your first issue below!")
-        
-        # Add New Issue Section
-        st.markdown("---")
-        st.subheader("Add New Issue")
-        
-        # Check if we're editing an existing issue
-        editing_issue = st.session_state.get('edit_issue', None)
-        is_editing_issue = editing_issue is not None
-        
-        if is_editing_issue:
-            st.info(f"Editing issue: {editing_issue['data'].get('id', 'Unknown')}")
-            issue_data = editing_issue['data']
-        else:
-            issue_data = {}
-        
-        # Issue form
-        with st.expander("Add Single Issue", expanded=True):
+            with col2:
+                if st.button("🗑️ Delete Selected Issue", type="secondary", key=widget_keys["delete_selected_issue"]):
+                    # Remove the issue
+                    node["issues"].pop(selected_issue_idx)
+                    # Save immediately so the deletion persists
+                    if save_data(data):
+                        st.success(f"Issue {selected_issue.get('id', 'Unknown')} deleted!")
+                    else:
+                        st.error("Failed to delete issue. Please try again.")
+                    rerun_admin_panel()
+    else:
+        st.info("No issues found. Add your first issue below!")
+    
+    # Add New Issue Section
+    st.markdown("---")
+    st.subheader("Add New Issue")
+    
+    # Check if we're editing an existing issue
+    editing_issue = st.session_state.get('edit_issue', None)
+    is_editing_issue = editing_issue is not None
+    
+    if is_editing_issue:
+        st.info(f"Editing issue: {editing_issue['data'].get('id', 'Unknown')}")
+        issue_data = editing_issue['data']
+    else:
+        issue_data = {}
+    
+    # Issue form
+    with st.expander("Add Single Issue", expanded=True):
+        with st.form(widget_keys["issue_form"], clear_on_submit=False):
             col1, col2 = st.columns(2)
-            
+        
             with col1:
                 issue_id = st.text_input("Issue ID*", value=issue_data.get('id', ''), 
                                        help="Unique identifier for the issue", key="new_issue_id")
@@ -805,19 +952,19 @@ elif tab_selection == "Admin":
                 status = st.selectbox("Status*", ["Open", "In Progress", "Closed"], 
                                    index=["Open", "In Progress", "Closed"].index(issue_data.get('status', 'Open')), 
                                    help="Current status of the issue", key="new_issue_status")
-            
+        
             with col2:
                 start_date = st.date_input("Start Date*", 
-                                         value=datetime.strptime(issue_data.get('start_date', get_today_string()), '%Y-%m-%d').date() if issue_data.get('start_date') else datetime.now().date(), 
+                                         value=_parse_date(issue_data['start_date']) if issue_data.get('start_date') else today, 
                                          help="When the issue was first identified", key="new_issue_start")
                 close_date = st.date_input("Close Date", 
-                                         value=datetime.strptime(issue_data.get('close_date', get_today_string()), '%Y-%m-%d').date() if issue_data.get('close_date') else None, 
+                                         value=_parse_date(issue_data['close_date']) if issue_data.get('close_date') else None, 
                                          help="When the issue was resolved (leave empty if still open)", key="new_issue_close")
-            
+        
             if is_editing_issue:
                 col1, col2 = st.columns(2)
                 with col1:
-                    if st.button("Update Issue", key=f"update_issue_{selected_subsystem}", type="primary"):
+                    if st.form_submit_button("Update Issue", type="primary"):
                         if issue_id and description and status and start_date:
                             # Validate date range
                             if close_date and not validate_date_range(start_date, close_date):
@@ -828,28 +975,26 @@ elif tab_selection == "Admin":
                                     "id": issue_id,
                                     "description": description,
                                     "status": status,
-                                    "start_date": start_date.strftime("%Y-%m-%d"),
-                                    "close_date": close_date.strftime("%Y-%m-%d") if close_date else None
+                                    "start_date": start_date.strftime(DATE_FMT),
+                                    "close_date": close_date.strftime(DATE_FMT) if close_date else None
                                 }
                                 # Clear edit mode
-                                if 'edit_issue' in st.session_state:
-                                    del st.session_state.edit_issue
+                                st.session_state.pop('edit_issue', None)
                                 # Save immediately so the update persists
                                 if save_data(data):
-                                    st.success(f"Issue updated!")
+                                    st.success(MSG_ISSUE_UPDATED)
                                 else:
-                                    st.error("Failed to update issue. Please try again.")
-                                st.rerun()
+                                    st.error(MSG_ISSUE_UPDATE_FAILED)
+                                rerun_admin_panel()
                         else:
-                            st.error("Please fill in all required fields (marked with *)")
-                
+                            st.error(MSG_REQUIRED)
+            
                 with col2:
-                    if st.button("Cancel Edit", key=f"cancel_issue_{selected_subsystem}", type="secondary"):
-                        if 'edit_issue' in st.session_state:
-                            del st.session_state.edit_issue
+                    if st.form_submit_button("Cancel Edit", type="secondary"):
+                        st.session_state.pop('edit_issue', None)
                         st.rerun()
             else:
-                if st.button("Add Issue", key=f"add_issue_{selected_subsystem}", type="primary"):
+                if st.form_submit_button("Add Issue", type="primary"):
                     if issue_id and description and status and start_date:
                         # Validate date range
                         if close_date and not validate_date_range(start_date, close_date):
@@ -859,15 +1004,152 @@ elif tab_selection == "Admin":
                                 "id": issue_id,
                                 "description": description,
                                 "status": status,
-                                "start_date": start_date.strftime("%Y-%m-%d"),
-                                "close_date": close_date.strftime("%Y-%m-%d") if close_date else None
+                                "start_date": start_date.strftime(DATE_FMT),
+                                "close_date": close_date.strftime(DATE_FMT) if close_date else None
                             }
                             node["issues"].append(new_issue)
                             # Save immediately so the issue persists after rerun
                             if save_data(data):
-                                st.success(f"Added new issue: {issue_id}")
+                                st.success(MSG_ISSUE_ADDED(issue_id))
                             else:
-                                st.error("Failed to save issue. Please try again.")
-                            st.rerun()
+                                st.error(MSG_ISSUE_SAVE_FAILED)
+                            rerun_admin_panel()
                     else:
-                        st.error("Please fill in all required fields (marked with *)")
+                        st.error(MSG_REQUIRED)
+
+# -------- Streamlit UI --------
+st.set_page_config(page_title="Pipeline Onboarding Dashboard", layout="wide", initial_sidebar_state="collapsed")
+st.title("Pipeline Onboarding Dashboard")
+
+# Load data and show status
+data, data_version = load_data()
+subsystem_index = build_subsystem_index(data)
+navigation = build_navigation(data_version, subsystem_index)
+
+# Show data source status and controls
+col1, col2 = st.columns([3, 1])
+
+with col1:
+    if data_version:
+        st.info(f"Data loaded from: data.json (Last modified: {datetime.fromtimestamp(data_version).strftime('%Y-%m-%d %H:%M:%S')})")
+    else:
+        st.info("Using default data (data.json will be created on first save)")
+
+with col2:
+    if st.button("Refresh Data", key="refresh_dashboard_main"):
+        st.rerun()
+
+# Initialize session state for tracking changes
+if 'data_modified' not in st.session_state:
+    st.session_state.data_modified = False
+
+# Sidebar navigation
+st.sidebar.title("Navigation")
+tab_selection = st.sidebar.radio("Select Tab", ["Dashboard", "Admin"])
+
+# Sidebar filters populated from data
+groups = list(navigation)
+selected_group = st.sidebar.selectbox("Select Level-1 Group", groups)
+subsystems = navigation.get(selected_group, [])
+selected_subsystem = st.sidebar.selectbox("Select Subsystem", subsystems)
+
+node = get_subsystem_node(subsystem_index, selected_group, selected_subsystem)
+
+# A subsystem with no stage counts under any pipeline type has nothing to show
+if not node or not any(node.get("pipelines", {}).values()):
+    st.warning("No pipeline records found. Please check your data source.")
+    st.stop()
+
+# Dashboard Tab
+if tab_selection == "Dashboard":
+    st.header("Dashboard View")
+
+    # Summary Metrics
+    totals = stage_totals(node)
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Finalized", totals["finalized"])
+    col2.metric("UAT", totals["uat"])
+    col3.metric("Planned", totals["planned"])
+    col4.metric("Production", totals["production"])
+
+    # Charts
+    colA, colB = st.columns(2)
+    pipelines = node.get("pipelines", {})
+    colA.plotly_chart(build_pipeline_type_pie(pipelines), use_container_width=True)
+    colB.plotly_chart(build_stage_bar(pipelines), use_container_width=True)
+
+    group_totals = subsystem_totals(data_version, data).get(selected_group, {})
+    st.plotly_chart(build_group_bar(group_totals, selected_group), use_container_width=True)
+
+    # Issues Summary Table (Read-only view)
+    if node and node.get("issues"):
+        st.header("Issues Overview")
+        today_str = get_today_string()
+        
+        # Prepare data for the table
+        issues = node.get("issues", [])
+        # Single pass over the issues for table columns, raw dates and status counts
+        ids, descriptions, statuses, start_dates, close_dates = [], [], [], [], []
+        raw_start_dates, raw_close_dates = [], []
+        status_counts = Counter()
+        for issue in issues:
+            status = issue["status"]
+            status_counts[status] += 1
+            start_date_str = issue.get("start_date", "")
+            close_date_str = issue.get("close_date", "")
+            raw_start_dates.append(start_date_str)
+            raw_close_dates.append(close_date_str)
+            ids.append(issue["id"])
+            descriptions.append(issue["description"])
+            statuses.append(status if status in ("Closed", "In Progress") else "Open")
+            start_dates.append(format_date_display(start_date_str))
+            close_dates.append(format_date_display(close_date_str))
+        blocked_days_series = calculate_blocked_days_series(raw_start_dates, raw_close_dates, today_str)
+        age_colors = get_issue_age_colors(blocked_days_series)
+        
+        # Truncate long descriptions in one vectorized pass
+        description_series = pd.Series(descriptions)
+        short_descriptions = description_series.str.slice(0, 50)
+        short_descriptions = short_descriptions.where(description_series.str.len() <= 50, short_descriptions + "...")
+        
+        # Create summary DataFrame
+        summary_df = pd.DataFrame({
+            "Issue ID": ids,
+            "Description": short_descriptions,
+            "Status": statuses,
+            "Start Date": start_dates,
+            "Close Date": close_dates,
+            "Blocked Days": blocked_days_series,
+            "Age Indicator": age_colors,
+        })
+        
+        # Display the table with styling
+        st.dataframe(
+            summary_df,
+            column_config={
+                "Age Indicator": st.column_config.TextColumn("Age", help="Recent (≤7 days), Moderate (8-30 days), Old (>30 days)"),
+                "Status": st.column_config.TextColumn("Status", help="Closed, In Progress, Open"),
+                "Blocked Days": st.column_config.NumberColumn("Days Blocked", help="Total days from start to close (or today if open)")
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+        
+        # Summary statistics
+        total_open = status_counts.get("Open", 0)
+        total_in_progress = status_counts.get("In Progress", 0)
+        total_closed = status_counts.get("Closed", 0)
+        total_blocked_days = int(blocked_days_series.sum())
+        
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Open Issues", total_open)
+        col2.metric("In Progress", total_in_progress)
+        col3.metric("Closed", total_closed)
+        col4.metric("Total Blocked Days", total_blocked_days)
+
+# Admin Tab
+elif tab_selection == "Admin":
+    st.header("Admin Panel")
+    st.info("Use this panel to edit pipeline data, contacts, and issues.")
+    
+    render_admin_panel(selected_group, selected_subsystem)